@@ -0,0 +1,45 @@
+import os
+
+# ==========================================
+# CẤU HÌNH GUNICORN (Procfile: gunicorn -c gunicorn_conf.py app:app)
+# ==========================================
+# preload_app: import app.py (genai, yt_dlp, SQLAlchemy, chọn model) MỘT lần trong master,
+# các worker fork ra dùng chung bộ nhớ (copy-on-write) thay vì mỗi worker tự khởi động lại.
+# worker_class gthread: request đang chờ Gemini / yt-dlp (I/O) không chặn request khác.
+# (Không dùng gevent: client gRPC của google-generativeai không tương thích monkey-patch.)
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+preload_app = True
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+worker_class = "gthread"
+# Request chủ yếu chờ I/O (tải video, Gemini upload/poll) nên 8 thread/worker vẫn nhẹ CPU
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Xử lý video có thể mất vài phút
+timeout = 1200
+graceful_timeout = 1200
+keepalive = 5
+
+# Không tái khởi động worker theo số request: với gthread + client poll job, max_requests nhỏ làm worker
+# restart vài giây một lần, cắt ngang job nền/SSE và xóa sạch cache trong RAM (user, response, Gemini, token bucket).
+# Cần giới hạn rò rỉ RAM thì đặt GUNICORN_MAX_REQUESTS ở mức hàng nghìn (0 = tắt).
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = max_requests // 10
+
+
+def pre_fork(server, worker):
+    # Chờ thread chọn model (bắt đầu lúc import app trong master) xong trước khi fork,
+    # để worker nhận luôn model đã chọn thay vì phải tự chọn lại
+    from app import wait_model_prefetch
+
+    wait_model_prefetch(timeout=30)
+
+
+def post_fork(server, worker):
+    # Kết nối DB và client Gemini tạo trong master không được dùng chung qua fork:
+    # bỏ pool kết nối kế thừa (không đóng socket của master) và tạo lại client Gemini.
+    from app import app, db, genai, MY_API_KEY
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+    genai.configure(api_key=MY_API_KEY)